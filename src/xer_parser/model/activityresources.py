@@ -1,105 +1,118 @@
+from collections import defaultdict
+from collections.abc import Iterator
+
+from xer_parser.model.classes._parsers import int_or_none
 from xer_parser.model.classes.taskrsrc import TaskRsrc
 
 __all__ = ["ActivityResources"]
 
+_TSV_TYPE = ("%T", "TASKRSRC")
+_TSV_FIELDS = (
+    "%F",
+    "taskrsrc_id",
+    "task_id",
+    "proj_id",
+    "cost_qty_link_flag",
+    "role_id",
+    "acct_id",
+    "rsrc_id",
+    "pobs_id",
+    "skill_level",
+    "remain_qty",
+    "target_qty",
+    "remain_qty_per_hr",
+    "target_lag_drtn_hr_cnt",
+    "target_qty_per_hr",
+    "act_ot_qty",
+    "act_reg_qty",
+    "relag_drtn_hr_cnt",
+    "ot_factor",
+    "cost_per_qty",
+    "target_cost",
+    "act_reg_cost",
+    "act_ot_cost",
+    "remain_cost",
+    "act_start_date",
+    "act_end_date",
+    "restart_date",
+    "reend_date",
+    "target_start_date",
+    "target_end_date",
+    "rem_late_start_date",
+    "rem_late_end_date",
+    "rollup_dates_flag",
+    "target_crv",
+    "remain_crv",
+    "actual_crv",
+    "ts_pend_act_end_flag",
+    "guid",
+    "rate_type",
+    "act_this_per_cost",
+    "act_this_per_qty",
+    "curv_id",
+    "rsrc_type",
+    "cost_per_qty_source_type",
+    "create_user",
+    "create_date",
+    "cbs_id",
+    "has_rsrchours",
+    "taskrsrc_sum_id",
+)
+
 
 class ActivityResources:
     def __init__(self) -> None:
-        self.index = 0
-        self._taskrsrc = []
+        # Raw (params, data) rows; full TaskRsrc objects are only built when
+        # a row is actually accessed, which keeps parsing of large TASKRSRC
+        # tables free of per-row object construction.
+        self._rows = []
+        self._materialized = {}
+        self._by_id = {}
+        self._by_rsrc = defaultdict(list)
+        self._by_task = defaultdict(list)
 
     def add(self, params, data) -> None:  # TODO: Add type annotation for params, data
-        self._taskrsrc.append(TaskRsrc(params, data))
+        i = len(self._rows)
+        self._rows.append((params, data))
+        self._by_id[int_or_none(params, "taskrsrc_id")] = i
+        self._by_rsrc[int_or_none(params, "rsrc_id")].append(i)
+        self._by_task[int_or_none(params, "task_id")].append(i)
+
+    def _materialize(self, i) -> TaskRsrc:
+        tr = self._materialized.get(i)
+        if tr is None:
+            params, data = self._rows[i]
+            tr = TaskRsrc(params, data)
+            self._materialized[i] = tr
+        return tr
 
     def find_by_id(self, id) -> TaskRsrc:
-        obj = list(filter(lambda x: x.taskrsrc_id == id, self._taskrsrc))
-        if len(obj) > 0:
-            return obj[0]
-        return None
+        i = self._by_id.get(id)
+        return self._materialize(i) if i is not None else None
 
     def get_tsv(self) -> list:
-        if len(self._taskrsrc) > 0:
-            tsv = []
-            tsv.append(["%T", "TASKRSRC"])
-            tsv.append(
-                [
-                    "%F",
-                    "taskrsrc_id",
-                    "task_id",
-                    "proj_id",
-                    "cost_qty_link_flag",
-                    "role_id",
-                    "acct_id",
-                    "rsrc_id",
-                    "pobs_id",
-                    "skill_level",
-                    "remain_qty",
-                    "target_qty",
-                    "remain_qty_per_hr",
-                    "target_lag_drtn_hr_cnt",
-                    "target_qty_per_hr",
-                    "act_ot_qty",
-                    "act_reg_qty",
-                    "relag_drtn_hr_cnt",
-                    "ot_factor",
-                    "cost_per_qty",
-                    "target_cost",
-                    "act_reg_cost",
-                    "act_ot_cost",
-                    "remain_cost",
-                    "act_start_date",
-                    "act_end_date",
-                    "restart_date",
-                    "reend_date",
-                    "target_start_date",
-                    "target_end_date",
-                    "rem_late_start_date",
-                    "rem_late_end_date",
-                    "rollup_dates_flag",
-                    "target_crv",
-                    "remain_crv",
-                    "actual_crv",
-                    "ts_pend_act_end_flag",
-                    "guid",
-                    "rate_type",
-                    "act_this_per_cost",
-                    "act_this_per_qty",
-                    "curv_id",
-                    "rsrc_type",
-                    "cost_per_qty_source_type",
-                    "create_user",
-                    "create_date",
-                    "cbs_id",
-                    "has_rsrchours",
-                    "taskrsrc_sum_id",
-                ]
-            )
-            for taskrsrc in self._taskrsrc:
-                tsv.append(taskrsrc.get_tsv())
-            return tsv
-        return []
+        if not self._rows:
+            return []
+        tsv = [list(_TSV_TYPE), list(_TSV_FIELDS)]
+        tsv.extend(tr.get_tsv() for tr in self)
+        return tsv
 
     def find_by_rsrc_id(self, id) -> TaskRsrc:
-        obj = list(filter(lambda x: x.rsrc_id == id, self._taskrsrc))
-        return obj
+        return [self._materialize(i) for i in self._by_rsrc.get(id, ())]
 
     def find_by_activity_id(self, id):  # TODO: Add correct return type annotation
-        obj = list(filter(lambda x: x.task_id == id and x.rsrc_id, self._taskrsrc))
-        return obj
+        return [
+            x
+            for x in (self._materialize(i) for i in self._by_task.get(id, ()))
+            if x.rsrc_id is not None
+        ]
 
     @property
     def count(self) -> int:
-        return len(self._taskrsrc)
+        return len(self._rows)
 
     def __len__(self) -> int:
-        return len(ActivityResources._taskrsrc)
-
-    def __iter__(self) -> "ActivityResources":
-        return self
+        return len(self._rows)
 
-    def __next__(self) -> TaskRsrc:
-        if self.index >= len(self._taskrsrc):
-            raise StopIteration
-        idx = self.index
-        self.index += 1
-        return self._taskrsrc[idx]
+    def __iter__(self) -> Iterator[TaskRsrc]:
+        return (self._materialize(i) for i in range(len(self._rows)))
@@ -9,9 +9,12 @@ class Calendars:
     def __init__(self) -> None:
         self.index: int = 0
         self._calendars: list[Calendar] = []
+        self._by_id: dict[int, Calendar] = {}
 
     def add(self, params: Any) -> None:
-        self._calendars.append(Calendar(params))
+        cal = Calendar(params)
+        self._calendars.append(cal)
+        self._by_id[cal.clndr_id] = cal
 
     def get_tsv(self) -> list[list[str]]:
         if len(self._calendars) > 0:
@@ -40,11 +43,8 @@ class Calendars:
             return tsv
         return []
 
-    def find_by_id(self, id: Any) -> Calendar | list[Calendar]:
-        obj: list[Calendar] = list(filter(lambda x: x.clndr_id == id, self._calendars))
-        if len(obj) > 0:
-            return obj[0]
-        return obj
+    def find_by_id(self, id: Any) -> Calendar | None:
+        return self._by_id.get(id)
 
     def count(self) -> int:
         return len(self._calendars)
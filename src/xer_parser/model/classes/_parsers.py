@@ -0,0 +1,113 @@
+"""Shared field-parsing helpers for the XER record classes.
+
+The record constructors all follow the same pattern of reading an optional
+value out of the params dict and converting it. Doing that inline means two
+dict lookups per field; these helpers do a single lookup and are reused
+across the record classes.
+"""
+
+import locale
+import sys
+from datetime import datetime
+
+__all__ = [
+    "DT_FMT",
+    "atof",
+    "atof_or_none",
+    "dt_or_none",
+    "fmt_dt",
+    "int_or_none",
+    "intern_or_none",
+    "strip_or_none",
+]
+
+# Every date column in an XER file uses this one fixed-width format.
+DT_FMT = "%Y-%m-%d %H:%M"
+
+# locale.atof re-queries the locale on every call. XER numerics use a plain
+# "." decimal point, so when the active locale does too (the common case)
+# float() can convert directly; the locale is checked once at import time.
+_conv = locale.localeconv()
+if _conv["decimal_point"] == "." and not _conv["thousands_sep"]:
+    atof = float
+else:
+    atof = locale.atof
+
+
+def strip_or_none(params, key):
+    """Return the stripped string value for ``key``, or None when absent/empty."""
+    v = params.get(key)
+    return v.strip() if v else None
+
+
+def atof_or_none(params, key, _atof=atof):
+    """Return the float value for ``key``, or None when absent/empty."""
+    v = params.get(key)
+    return _atof(v) if v else None
+
+
+def intern_or_none(params, key, _intern=sys.intern):
+    """Like :func:`strip_or_none`, but interns the result.
+
+    Meant for enum-like columns (flags, type codes) that repeat a handful of
+    distinct values across thousands of rows; interning makes every row share
+    one string object.
+    """
+    v = params.get(key)
+    return _intern(v.strip()) if v else None
+
+
+def int_or_none(params, key, _int=int):
+    """Return the int value for ``key``, or None when absent/empty."""
+    v = params.get(key)
+    return _int(v.strip()) if v else None
+
+
+def dt_or_none(params, key, _int=int):
+    """Return the datetime value for ``key``, or None when absent/empty.
+
+    The format is always the fixed-width ``YYYY-MM-DD HH:MM``, so the
+    components are sliced out directly instead of going through
+    ``datetime.strptime``, which re-interprets the format string on every
+    call. The fast path only accepts exactly 16 characters with the
+    separators in their fixed positions — slicing alone would silently
+    accept trailing garbage or wrong punctuation that strptime rejects —
+    and anything else goes through strptime so malformed values fail
+    with the same error as before.
+    """
+    v = params.get(key)
+    if not v:
+        return None
+    s = v.strip()
+    if (
+        len(s) == 16
+        and s[4] == "-"
+        and s[7] == "-"
+        and s[10] == " "
+        and s[13] == ":"
+    ):
+        try:
+            return datetime(
+                _int(s[0:4]),
+                _int(s[5:7]),
+                _int(s[8:10]),
+                _int(s[11:13]),
+                _int(s[14:16]),
+            )
+        except ValueError:
+            pass
+    return datetime.strptime(s, DT_FMT)
+
+
+def fmt_dt(dt):
+    """Format a datetime as the XER ``YYYY-MM-DD HH:MM`` string, or None.
+
+    Equivalent to ``dt.strftime(DT_FMT)`` but without re-parsing the format
+    string on every call, which matters in the TSV-export loop where every
+    date column of every row goes through it.
+    """
+    if dt is None:
+        return None
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+    )
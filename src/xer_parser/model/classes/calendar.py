@@ -1,84 +1,99 @@
-import locale
-from typing import ClassVar
-
+from xer_parser.model.classes._parsers import (
+    atof_or_none,
+    int_or_none,
+    intern_or_none,
+    strip_or_none,
+)
 from xer_parser.model.classes.calendar_data import CalendarData
 
 
 class Calendar:
-    obj_list: ClassVar[list] = []
+    __slots__ = (
+        "base_clndr_id",
+        "clndr_data",
+        "clndr_id",
+        "clndr_name",
+        "clndr_type",
+        "day_hr_cnt",
+        "default_flag",
+        "last_chng_date",
+        "month_hr_cnt",
+        "proj_id",
+        "rsrc_private",
+        "week_hr_cnt",
+        "year_hr_cnt",
+        "_exceptions",
+        "_working_days",
+        "_working_hours",
+    )
 
     def __init__(self, params):
         # Unique ID generated by the system.
-        self.clndr_id = (
-            int(params.get("clndr_id").strip()) if params.get("clndr_id") else None
-        )
+        self.clndr_id = int_or_none(params, "clndr_id")
         # Identifies the default global calendar (applies to global calendars only).
-        self.default_flag = (
-            params.get("default_flag").strip() if params.get("default_flag") else None
-        )
+        self.default_flag = intern_or_none(params, "default_flag")
         # The name of the calendar.
-        self.clndr_name = (
-            params.get("clndr_name").strip() if params.get("clndr_name") else None
-        )
-        self.proj_id = params.get("proj_id").strip() if params.get("proj_id") else None
+        self.clndr_name = strip_or_none(params, "clndr_name")
+        self.proj_id = strip_or_none(params, "proj_id")
         # The global calendar to which this calendar is linked.  Any changes to the global calendar are automatically
         #  propagated to this calendar.
-        self.base_clndr_id = (
-            params.get("base_clndr_id").strip() if params.get("base_clndr_id") else None
-        )
+        self.base_clndr_id = strip_or_none(params, "base_clndr_id")
         # Date of last changes to calendar.
-        self.last_chng_date = (
-            params.get("last_chng_date").strip()
-            if params.get("last_chng_date")
-            else None
-        )
+        self.last_chng_date = strip_or_none(params, "last_chng_date")
         # The calendar type - either global, resource, or project. Global calendars can be assigned to projects and
         # resources. Resource calendars can be assigned only to resources. Project
         # calendars are specific to projects.
-        self.clndr_type = (
-            params.get("clndr_type").strip() if params.get("clndr_type") else None
-        )
+        self.clndr_type = intern_or_none(params, "clndr_type")
         # The number of work hours per day. This conversion factor is used for displaying time units and durations in
-        self.day_hr_cnt = (
-            locale.atof(params.get("day_hr_cnt")) if params.get("day_hr_cnt") else None
-        )
+        self.day_hr_cnt = atof_or_none(params, "day_hr_cnt")
         # The number of work hours per week. This conversion factor is used for displaying time units and durations
         # in the user's selected display formats.
-        self.week_hr_cnt = (
-            locale.atof(params.get("week_hr_cnt"))
-            if params.get("week_hr_cnt")
-            else None
-        )
+        self.week_hr_cnt = atof_or_none(params, "week_hr_cnt")
         # The number of work hours per month. This conversion factor is used for displaying time units and durations
         # in the user's selected display formats.
-        self.month_hr_cnt = (
-            locale.atof(params.get("month_hr_cnt"))
-            if params.get("month_hr_cnt")
-            else None
-        )
+        self.month_hr_cnt = atof_or_none(params, "month_hr_cnt")
         # The number of work hours per year. This conversion factor is used for displaying time units and durations
         # in the user's selected display formats.
-        self.year_hr_cnt = (
-            locale.atof(params.get("year_hr_cnt"))
-            if params.get("year_hr_cnt")
-            else None
-        )
-        self.rsrc_private = (
-            params.get("rsrc_private").strip() if params.get("rsrc_private") else None
-        )
-        self.clndr_data = (
-            params.get("clndr_data").strip() if params.get("clndr_data") else None
-        )
-        self.working_days = {}
-        self.exceptions = []
+        self.year_hr_cnt = atof_or_none(params, "year_hr_cnt")
+        self.rsrc_private = intern_or_none(params, "rsrc_private")
+        self.clndr_data = strip_or_none(params, "clndr_data")
+        # clndr_data is only decoded when the working times are actually
+        # queried; most calendars are just used for their hour-count factors.
+        self._working_days = None
+        self._working_hours = None
+        self._exceptions = None
 
+    def _parse_clndr_data(self):
         if self.clndr_data:
+            # The CalendarData decoder already computes days/exceptions in
+            # its constructor; take them over and let the decoder (and its
+            # copy of the raw string) go away instead of re-deriving them.
             c = CalendarData(self.clndr_data)
-            self.working_days = c.get_days()
-            self.working_hours = c.get_work_pattern()
-            self.exceptions = c.get_exceptions()
+            self._working_days = c.working_days
+            self._working_hours = c.get_work_pattern()
+            self._exceptions = c.exceptions
+        else:
+            self._working_days = {}
+            self._working_hours = []
+            self._exceptions = []
+
+    @property
+    def working_days(self):
+        if self._working_days is None:
+            self._parse_clndr_data()
+        return self._working_days
 
-        Calendar.obj_list.append(self)
+    @property
+    def working_hours(self):
+        if self._working_hours is None:
+            self._parse_clndr_data()
+        return self._working_hours
+
+    @property
+    def exceptions(self):
+        if self._exceptions is None:
+            self._parse_clndr_data()
+        return self._exceptions
 
     def get_tsv(self):
         return [
@@ -98,10 +113,5 @@ class Calendar:
             self.clndr_data,
         ]
 
-    @staticmethod
-    def find_by_id(id):
-        obj = list(filter(lambda x: x.clndr_id == id, Calendar.obj_list))
-        return obj[0] if obj else None
-
     def __repr__(self):
         return f"{self.clndr_name} : {self.day_hr_cnt}\n{self.clndr_data}"
@@ -3,7 +3,9 @@ class Data:
         self.projects = None
         self.wbss = None
         self.tasks = None
+        self.calendars = None
         self.resources = None
         self.taskresource = None
         self.taskactvcodes = None
+        self.taskprocs = None
         self.predecessors = None
@@ -35,6 +35,80 @@ class Project:
         List of all WBS elements in this project
     """
 
+    __slots__ = (
+        "acct_id",
+        "act_pct_link_flag",
+        "act_this_per_link_flag",
+        "add_act_remain_flag",
+        "add_by_name",
+        "add_date",
+        "allow_complete_flag",
+        "allow_neg_act_flag",
+        "apply_actuals_date",
+        "base_type_id",
+        "baseline_names_to_export",
+        "baselines_to_export",
+        "batch_sum_flag",
+        "checkout_flag",
+        "clndr_id",
+        "close_period_flag",
+        "cost_qty_recalc_flag",
+        "cr_external_key",
+        "critical_drtn_hr_cnt",
+        "critical_path_type",
+        "data",
+        "def_complete_pct_type",
+        "def_cost_per_qty",
+        "def_duration_type",
+        "def_qty_type",
+        "def_rate_type",
+        "def_rollup_dates_flag",
+        "def_task_type",
+        "export_flag",
+        "fcst_start_date",
+        "fintmpl_id",
+        "fy_start_month_num",
+        "guid",
+        "last_baseline_update_date",
+        "last_checksum",
+        "last_fin_dates_id",
+        "last_recalc_date",
+        "last_tasksum_date",
+        "loaded_scope_level",
+        "location_id",
+        "name_sep_char",
+        "new_fin_dates_id",
+        "next_data_date",
+        "orig_proj_id",
+        "plan_end_date",
+        "plan_start_date",
+        "priority_num",
+        "proj_id",
+        "proj_short_name",
+        "proj_url",
+        "project_flag",
+        "rem_target_link_flag",
+        "reset_planned_flag",
+        "rsrc_multi_assign_flag",
+        "rsrc_self_add_flag",
+        "scd_end_date",
+        "source_proj_id",
+        "step_complete_flag",
+        "strgy_priority_num",
+        "sum_assign_level",
+        "sum_base_proj_id",
+        "sum_refresh_date",
+        "sumtask_loaded",
+        "task_code_base",
+        "task_code_prefix",
+        "task_code_prefix_flag",
+        "task_code_step",
+        "trsrcsum_loaded",
+        "use_project_baseline_flag",
+        "wbs_max_sum_level",
+        "web_local_root_path",
+    )
+
     def __init__(self, params: dict[str, Any], data: Any) -> None:
         """
         Initialize a Project object from XER file parameters.
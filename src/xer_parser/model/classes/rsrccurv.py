@@ -1,125 +1,63 @@
-import locale
-from typing import ClassVar
+from array import array
+from math import isnan, nan
+
+from xer_parser.model.classes._parsers import (
+    atof,
+    int_or_none,
+    intern_or_none,
+    strip_or_none,
+)
+
+
+def distribute_loads(curve_matrix, curve_idx, qty):
+    """Distribute quantities across resource curves in one bulk pass.
+
+    Parameters
+    ----------
+    curve_matrix : sequence of 21-element rows
+        Packed percentage rows, e.g. from ``ResourceCurves.curve_matrix()``.
+    curve_idx : sequence of int
+        For each quantity, the row index of its curve in ``curve_matrix``.
+    qty : sequence of float
+        Quantities to distribute.
+
+    Returns
+    -------
+    list of array('d')
+        One 21-element row per quantity with ``row[j] = curve[j] * qty / 100``.
+    """
+    return [
+        array("d", (v * q * 0.01 for v in curve_matrix[c]))
+        for c, q in zip(curve_idx, qty, strict=True)
+    ]
 
 
 class ResourceCurve:
-    obj_list: ClassVar[list] = []
+    __slots__ = ("curv_id", "curv_name", "default_flag", "pct_usage")
 
     def __init__(self, params):
-        self.curv_id = int(params.get("curv_id")) if params.get("curv_id") else None
-        self.curv_name = (
-            params.get("curv_name").strip() if params.get("curv_id") else None
-        )
-        self.default_flag = (
-            params.get("default_flag") if params.get("default_flag") else None
-        )
-        self.pct_usage_0 = (
-            locale.atof(params.get("pct_usage_0"))
-            if params.get("pct_usage_0")
-            else None
-        )
-        self.pct_usage_1 = (
-            locale.atof(params.get("pct_usage_1"))
-            if params.get("pct_usage_1")
-            else None
-        )
-        self.pct_usage_2 = (
-            locale.atof(params.get("pct_usage_2"))
-            if params.get("pct_usage_2")
-            else None
-        )
-        self.pct_usage_3 = (
-            locale.atof(params.get("pct_usage_3"))
-            if params.get("pct_usage_3")
-            else None
-        )
-        self.pct_usage_4 = (
-            locale.atof(params.get("pct_usage_4"))
-            if params.get("pct_usage_4")
-            else None
-        )
-        self.pct_usage_5 = (
-            locale.atof(params.get("pct_usage_5"))
-            if params.get("pct_usage_5")
-            else None
-        )
-        self.pct_usage_6 = (
-            locale.atof(params.get("pct_usage_6"))
-            if params.get("pct_usage_6")
-            else None
-        )
-        self.pct_usage_7 = (
-            locale.atof(params.get("pct_usage_7"))
-            if params.get("pct_usage_7")
-            else None
-        )
-        self.pct_usage_8 = (
-            locale.atof(params.get("pct_usage_8"))
-            if params.get("pct_usage_8")
-            else None
-        )
-        self.pct_usage_9 = (
-            locale.atof(params.get("pct_usage_9"))
-            if params.get("pct_usage_9")
-            else None
-        )
-        self.pct_usage_10 = (
-            locale.atof(params.get("pct_usage_10"))
-            if params.get("pct_usage_10")
-            else None
-        )
-        self.pct_usage_11 = (
-            locale.atof(params.get("pct_usage_11"))
-            if params.get("pct_usage_11")
-            else None
-        )
-        self.pct_usage_12 = (
-            locale.atof(params.get("pct_usage_12"))
-            if params.get("pct_usage_12")
-            else None
-        )
-        self.pct_usage_13 = (
-            locale.atof(params.get("pct_usage_13"))
-            if params.get("pct_usage_13")
-            else None
-        )
-        self.pct_usage_14 = (
-            locale.atof(params.get("pct_usage_14"))
-            if params.get("pct_usage_14")
-            else None
-        )
-        self.pct_usage_15 = (
-            locale.atof(params.get("pct_usage_15"))
-            if params.get("pct_usage_15")
-            else None
-        )
-        self.pct_usage_16 = (
-            locale.atof(params.get("pct_usage_16"))
-            if params.get("pct_usage_16")
-            else None
-        )
-        self.pct_usage_17 = (
-            locale.atof(params.get("pct_usage_17"))
-            if params.get("pct_usage_17")
-            else None
-        )
-        self.pct_usage_18 = (
-            locale.atof(params.get("pct_usage_18"))
-            if params.get("pct_usage_18")
-            else None
-        )
-        self.pct_usage_19 = (
-            locale.atof(params.get("pct_usage_19"))
-            if params.get("pct_usage_19")
-            else None
-        )
-        self.pct_usage_20 = (
-            locale.atof(params.get("pct_usage_20"))
-            if params.get("pct_usage_20")
-            else None
-        )
+        self.curv_id = int_or_none(params, "curv_id")
+        self.curv_name = strip_or_none(params, "curv_name")
+        self.default_flag = intern_or_none(params, "default_flag")
+        # Percentages are kept in one packed double array (missing values as
+        # NaN) instead of 21 boxed float attributes per curve.
+        self.pct_usage = array("d", [nan] * 21)
+        for i in range(21):
+            v = params.get(f"pct_usage_{i}")
+            if v:
+                self.pct_usage[i] = atof(v)
 
-        ResourceCurve.obj_list.append(self)
+    def __getattr__(self, name):
+        # Legacy per-index attribute names (pct_usage_0 .. pct_usage_20).
+        # The digit check keeps signed suffixes like "pct_usage_-1" from
+        # indexing the array from the end instead of raising.
+        if name.startswith("pct_usage_") and name[10:].isdigit():
+            try:
+                v = self.pct_usage[int(name[10:])]
+            except IndexError:
+                raise AttributeError(name) from None
+            return None if isnan(v) else v
+        raise AttributeError(name)
 
     def get_tsv(self):
         tsv = [
@@ -127,33 +65,9 @@ class ResourceCurve:
             self.curv_id,
             self.curv_name,
             self.default_flag,
-            self.pct_usage_0,
-            self.pct_usage_1,
-            self.pct_usage_2,
-            self.pct_usage_3,
-            self.pct_usage_4,
-            self.pct_usage_5,
-            self.pct_usage_6,
-            self.pct_usage_7,
-            self.pct_usage_8,
-            self.pct_usage_9,
-            self.pct_usage_10,
-            self.pct_usage_11,
-            self.pct_usage_12,
-            self.pct_usage_13,
-            self.pct_usage_14,
-            self.pct_usage_15,
-            self.pct_usage_16,
-            self.pct_usage_17,
-            self.pct_usage_18,
-            self.pct_usage_19,
-            self.pct_usage_20,
         ]
+        tsv.extend(None if isnan(v) else v for v in self.pct_usage)
         return tsv
 
-    @classmethod
-    def find_by_id(cls, id):
-        return next((x for x in cls.obj_list if x.curv_id == id), None)
-
     def __repr__(self):
         return self.curv_name
@@ -1,24 +1,13 @@
-from typing import ClassVar
+from xer_parser.model.classes._parsers import int_or_none
 
 
 class ResourceCat:
-    obj_list: ClassVar[list] = []
+    __slots__ = ("rsrc_catg_id", "rsrc_catg_type_id", "rsrc_id")
 
     def __init__(self, params):
-        self.rsrc_id = (
-            int(params.get("rsrc_id").strip()) if params.get("rsrc_id") else None
-        )
-        self.rsrc_catg_type_id = (
-            int(params.get("rsrc_catg_type_id").strip())
-            if params.get("rsrc_catg_type_id")
-            else None
-        )
-        self.rsrc_catg_id = (
-            int(params.get("rsrc_catg_type_id").strip())
-            if params.get("rsrc_catg_type_id")
-            else None
-        )
-        ResourceCat.obj_list.append(self)
+        self.rsrc_id = int_or_none(params, "rsrc_id")
+        self.rsrc_catg_type_id = int_or_none(params, "rsrc_catg_type_id")
+        self.rsrc_catg_id = int_or_none(params, "rsrc_catg_id")
 
     def get_tsv(self):
         tsv = ["%R", self.rsrc_id, self.rsrc_catg_type_id, self.rsrc_catg_id]
@@ -28,4 +17,4 @@ class ResourceCat:
         return self.rsrc_id
 
     def __repr__(self):
-        return self.rsrc_id + " has been assign category " + self.rsrc_catg_id
+        return f"{self.rsrc_id} has been assign category {self.rsrc_catg_id}"
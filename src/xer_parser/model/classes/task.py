@@ -1,9 +1,202 @@
-import locale
+import weakref
 from datetime import datetime
-from typing import Any, ClassVar
-
-from xer_parser.model.classes.calendar import Calendar
-from xer_parser.model.taskprocs import TaskProcs
+from operator import attrgetter
+from typing import Any
+
+from xer_parser.model.classes._parsers import (
+    atof_or_none,
+    dt_or_none,
+    fmt_dt,
+    int_or_none,
+    intern_or_none,
+    strip_or_none,
+)
+
+
+def _remain_drtn_or_zero(params, key):
+    # Remaining duration equals the original duration before the activity
+    # starts and zero once it completes, hence the 0 default.
+    v = atof_or_none(params, key)
+    return 0 if v is None else v
+
+
+# Conversion spec for the lazily materialized Task fields: attribute name
+# -> (converter, params key). See the TASK table of the XER specification
+# for the P6 meaning of each column.
+_FIELD_SPECS: dict[str, tuple] = {}
+for _name in ("proj_id", "wbs_id", "clndr_id", "rsrc_id"):
+    _FIELD_SPECS[_name] = (int_or_none, _name)
+for _name in (
+    "phys_complete_pct",
+    "est_wt",
+    "total_float_hr_cnt",
+    "free_float_hr_cnt",
+    "act_work_qty",
+    "remain_work_qty",
+    "target_work_qty",
+    "target_drtn_hr_cnt",
+    "target_equip_qty",
+    "act_equip_qty",
+    "remain_equip_qty",
+    "act_this_per_work_qty",
+    "act_this_per_equip_qty",
+):
+    _FIELD_SPECS[_name] = (atof_or_none, _name)
+for _name in (
+    "task_name",
+    "int_path",
+    "int_path_order",
+    "location_id",
+):
+    _FIELD_SPECS[_name] = (strip_or_none, _name)
+# Flags and type codes draw from a handful of distinct values across the
+# whole project, so every task shares one interned string per value.
+# task_code and the guids are interned too: they are the join keys of
+# cross-task analytics, and interned keys compare by pointer in dict
+# lookups and == chains.
+for _name in (
+    "task_code",
+    "guid",
+    "tmpl_guid",
+    "create_user",
+    "update_user",
+    "rev_fdbk_flag",
+    "lock_plan_flag",
+    "auto_compute_act_flag",
+    "complete_pct_type",
+    "task_type",
+    "duration_type",
+    "status_code",
+    "cstr_type",
+    "cstr_type2",
+    "priority_type",
+    "driving_path_flag",
+):
+    _FIELD_SPECS[_name] = (intern_or_none, _name)
+for _name in (
+    "cstr_date",
+    "act_start_date",
+    "act_end_date",
+    "late_start_date",
+    "late_end_date",
+    "expect_end_date",
+    "early_start_date",
+    "early_end_date",
+    "restart_date",
+    "reend_date",
+    "target_start_date",
+    "target_end_date",
+    "rem_late_start_date",
+    "rem_late_end_date",
+    "suspend_date",
+    "resume_date",
+    "cstr_date2",
+    "external_early_start_date",
+    "external_late_end_date",
+    "create_date",
+    "update_date",
+):
+    _FIELD_SPECS[_name] = (dt_or_none, _name)
+_FIELD_SPECS["remain_drtn_hr_cnt"] = (
+    _remain_drtn_or_zero,
+    "remain_drtn_hr_cnt",
+)
+del _name
+
+
+# TASK column order of the TSV export. The attrgetter pulls all 60 values
+# in one C call; _TSV_DT_IDX marks the positions (offset by the leading %R
+# cell) holding datetimes that need formatting, derived from the schema.
+_TSV_ATTRS = (
+    "task_id",
+    "proj_id",
+    "wbs_id",
+    "clndr_id",
+    "phys_complete_pct",
+    "rev_fdbk_flag",
+    "est_wt",
+    "lock_plan_flag",
+    "auto_compute_act_flag",
+    "complete_pct_type",
+    "task_type",
+    "duration_type",
+    "status_code",
+    "task_code",
+    "task_name",
+    "rsrc_id",
+    "total_float_hr_cnt",
+    "free_float_hr_cnt",
+    "remain_drtn_hr_cnt",
+    "act_work_qty",
+    "remain_work_qty",
+    "target_work_qty",
+    "target_drtn_hr_cnt",
+    "target_equip_qty",
+    "act_equip_qty",
+    "remain_equip_qty",
+    "cstr_date",
+    "act_start_date",
+    "act_end_date",
+    "late_start_date",
+    "late_end_date",
+    "expect_end_date",
+    "early_start_date",
+    "early_end_date",
+    "restart_date",
+    "reend_date",
+    "target_start_date",
+    "target_end_date",
+    "rem_late_start_date",
+    "rem_late_end_date",
+    "cstr_type",
+    "priority_type",
+    "suspend_date",
+    "resume_date",
+    "int_path",
+    "int_path_order",
+    "guid",
+    "tmpl_guid",
+    "cstr_date2",
+    "cstr_type2",
+    "driving_path_flag",
+    "act_this_per_work_qty",
+    "act_this_per_equip_qty",
+    "external_early_start_date",
+    "external_late_end_date",
+    "create_date",
+    "update_date",
+    "create_user",
+    "update_user",
+    "location_id",
+)
+_TSV_GET = attrgetter(*_TSV_ATTRS)
+_TSV_DT_IDX = tuple(
+    i + 1
+    for i, a in enumerate(_TSV_ATTRS)
+    if a in _FIELD_SPECS and _FIELD_SPECS[a][0] is dt_or_none
+)
+
+
+def _compile_materialize_all(specs):
+    # Build one straight-line function from the field schema: a single
+    # params.get per field with the converter pre-bound, no per-field dict
+    # lookup into the schema and no __getattr__ round trip. Used by bulk
+    # paths (TSV export) that are going to touch every column anyway.
+    ns = {}
+    lines = [
+        "def _materialize_all(self):",
+        "    params = self._params",
+        "    if params is None:",
+        "        return",
+    ]
+    for i, (name, (conv, key)) in enumerate(specs.items()):
+        fn = f"_conv{i}"
+        ns[fn] = conv
+        lines.append(f"    self.{name} = {fn}(params, {key!r})")
+    # Every field is converted now, so the raw row can be released.
+    lines.append("    self._params = None")
+    exec("\n".join(lines), ns)  # noqa: S102
+    return ns["_materialize_all"]
 
 
 class Task:
@@ -56,12 +249,86 @@ class Task:
         Total float in hours
     """
 
-    obj_list: ClassVar[list["Task"]] = []
+    __slots__ = (
+        "_duration",
+        "_end_date",
+        "_params",
+        "_pred",
+        "_succ",
+        "act_end_date",
+        "act_equip_qty",
+        "act_start_date",
+        "act_this_per_equip_qty",
+        "act_this_per_work_qty",
+        "act_work_qty",
+        "auto_compute_act_flag",
+        "calendar",
+        "clndr_id",
+        "complete_pct_type",
+        "create_date",
+        "create_user",
+        "cstr_date",
+        "cstr_date2",
+        "cstr_type",
+        "cstr_type2",
+        "data",
+        "driving_path_flag",
+        "duration_type",
+        "early_end_date",
+        "early_start_date",
+        "est_wt",
+        "expect_end_date",
+        "external_early_start_date",
+        "external_late_end_date",
+        "free_float_hr_cnt",
+        "guid",
+        "int_path",
+        "int_path_order",
+        "late_end_date",
+        "late_start_date",
+        "location_id",
+        "lock_plan_flag",
+        "logic_missing",
+        "phys_complete_pct",
+        "priority_type",
+        "proj_id",
+        "reend_date",
+        "rem_late_end_date",
+        "rem_late_start_date",
+        "remain_drtn_hr_cnt",
+        "remain_equip_qty",
+        "remain_work_qty",
+        "restart_date",
+        "resume_date",
+        "rev_fdbk_flag",
+        "rsrc_id",
+        "status_code",
+        "suspend_date",
+        "target_drtn_hr_cnt",
+        "target_end_date",
+        "target_equip_qty",
+        "target_start_date",
+        "target_work_qty",
+        "task_code",
+        "task_id",
+        "task_name",
+        "task_type",
+        "tmpl_guid",
+        "total_float_hr_cnt",
+        "update_date",
+        "update_user",
+        "wbs_id",
+    )
 
     def __init__(self, params: dict[str, Any], data: Any) -> None:
         """
         Initialize a Task object from XER file parameters.
 
+        Field conversion is deferred: the raw params dict is kept and each
+        attribute is converted on first access (see ``__getattr__``). Batch
+        passes that only touch a handful of the ~60 TASK columns skip the
+        conversion cost of all the others.
+
         Parameters
         ----------
         params : Dict[str, Any]
@@ -69,382 +336,45 @@ class Task:
         data : Any
             Reference to the main data container
         """
-        # Unique ID generated by the system.
-        self.task_id = int(params.get("task_id")) if params.get("task_id") else None
-        # project to which the activity belongs referenced by system generated unique id
-        self.proj_id = int(params.get("proj_id")) if params.get("proj_id") else None
-        # wbs element activity assigned to referenced by system unique id
-        self.wbs_id = int(params.get("wbs_id")) if params.get("wbs_id") else None
-        # calendar assigned to activity referenced by system unique id
-        self.clndr_id = int(params.get("clndr_id")) if params.get("clndr_id") else None
-        # The physical percent complete can either be user entered or calculated from the activity's weighted steps.
-        #  There is a project setting specifying this.
-        self.phys_complete_pct = (
-            locale.atof(params.get("phys_complete_pct"))
-            if "phys_complete_pct" in params
-            else None
-        )
-        # Indicates that the primary resource has sent feedback notes about this activity which have not been
-        # reviewed yet.
-        self.rev_fdbk_flag = (
-            params.get("rev_fdbk_flag") if params.get("rev_fdbk_flag") else None
-        )
-        # The estimation weight for the activity, used for top-down estimation. Top-down estimation weights are used
-        # to calculate the proportion of units that each activity receives in relation to the other activities within
-        #  the same WBS. Top-down estimation distributes estimated units in a top-down manner to activities using the
-        #  WBS hierarchy.
-
-        self.est_wt = (
-            locale.atof(params.get("est_wt").strip())
-            if "est_wt" in params and params.get("est_wt") != ""
-            else None
-        )
-        # Indicates that the planned labor and nonlabor units for the activity will not be modified by top-down
-        # estimation.
-        self.lock_plan_flag = (
-            params.get("lock_plan_flag") if params.get("lock_plan_flag") else None
-        )
-        # Identifies whether the actual and remaining cost for the expense are computed automatically using the
-        # planned cost and the activity's schedule percent complete.  If this option is selected,
-        # the actual/remaining cost are automatically updated when project actuals are applied.  This assumes the
-        # expenses are made according to plan.
-        self.auto_compute_act_flag = (
-            params.get("auto_compute_act_flag")
-            if params.get("auto_compute_act_flag")
-            else None
-        )
-        # The activity percent complete type is one of ""Duration"", ""Units"", or ""Physical"". The percent complete
-        #  type controls whether the Activity % Complete is tied to the Duration % Complete, the Units % Complete,
-        # or the Physical % Complete for the activity. Set the percent complete type to ""Duration"" for activities
-        # which are duration driven, for example, administration tasks and training classes.  Set the percent
-        # complete type to ""Physical"" for activities which are work-product driven, for example, creating a
-        # document or a product. Set the percent complete type to ""Units"" for activities which are work effort
-        # driven, for example, providing a consulting service.
-        self.complete_pct_type = (
-            params.get("complete_pct_type").strip()
-            if params.get("complete_pct_type")
-            else None
-        )
-        # The type of activity, either  'Task Dependent', 'Resource Dependent', 'Level of Effort', 'Start Milestone'
-        # or 'Finish Milestone'.   A Task Dependent activity is scheduled using the activity's calendar rather than
-        # the calendars of the assigned resources.  A Resource Dependent activity is scheduled using the calendars of
-        #  the assigned resources.  This type is used when several resources are assigned to the activity,
-        # but they may work separately.  A Start/Finish Milestone is a zero-duration activity, marking a significant
-        # start/end of project event. A Level of Effort activity has a duration which is determined by its dependent
-        # activities. Administration-type activities are typically level of effort.
-        self.task_type = (
-            params.get("task_type").strip() if params.get("task_type") else None
-        )
-        # The duration type of the activity. One of ""Fixed Units per Time"", ""Fixed Duration"", or ""Fixed Units"".
-        #   For Fixed Units per Time activities, the resource units per time are constant when the activity duration
-        # or units are changed.  This type is used when an activity has fixed resources with fixed productivity
-        # output per time period.  For Fixed Duration activities, the activity duration is constant as the units or
-        # resource units per time are changed. This type is used when the activity is to be completed within a fixed
-        # time period regardless of the resources assigned.  For Fixed Units activities, the activity units are
-        # constant when the duration or resource units per time are changed. This type is used when the total amount
-        # of work is fixed, and increasing the resources can decrease the activity duration.
-        self.duration_type = (
-            params.get("duration_type").strip() if params.get("duration_type") else None
-        )
-        # The current status of the activity, either Not Started, In Progress, or Completed.
-        self.status_code = (
-            params.get("status_code").strip() if params.get("status_code") else None
-        )
-        # A short ID which uniquely identifies the activity within the project.
-        self.task_code = (
-            params.get("task_code").strip() if params.get("task_code") else None
-        )
-        # The name of the activity. The activity name does not have to be unique.
-        self.task_name = (
-            params.get("task_name").strip() if params.get("task_name") else None
-        )
-        # Resource ID Name
-        self.rsrc_id = (
-            int(params.get("rsrc_id").strip()) if params.get("rsrc_id") else None
-        )
-        # The amount of time the wbs can be delayed before delaying the project finish date. Total int can be
-        # computed as Late Start - Early Start or as Late Finish - Early Finish; this option can be set when running
-        # the project scheduler.
-        self.total_float_hr_cnt = (
-            locale.atof(params.get("total_float_hr_cnt").strip())
-            if params.get("total_float_hr_cnt")
-            and params.get("total_float_hr_cnt") != ""
-            else None
-        )
-        # The amount of time the activity can be delayed before delaying the start
-        # date of any successor activity.
-        self.free_float_hr_cnt = (
-            locale.atof(params.get("free_float_hr_cnt"))
-            if params.get("free_float_hr_cnt")
-            else None
-        )
-        # Remaining duration is the total working time from the activity remaining start date to the remaining finish
-        #  date. The remaining working time is computed using the activity's calendar. Before the activity is
-        # started, the remaining duration is the same as the Original Duration. After the activity is completed the
-        # remaining duration is zero.
-        self.remain_drtn_hr_cnt = (
-            locale.atof(params.get("remain_drtn_hr_cnt").strip())
-            if params.get("remain_drtn_hr_cnt")
-            else 0
-        )
-        # The total actual labor units for all child activities
-        self.act_work_qty = (
-            locale.atof(params.get("act_work_qty"))
-            if params.get("act_work_qty")
-            else None
-        )
-        # The remaining units for all labor resources assigned to the activity. The remaining units reflects the work
-        #  remaining to be done for the activity. Before the activity is started, the remaining units are the same as
-        #  the planned units. After the activity is completed, the remaining units are zero.
-        self.remain_work_qty = (
-            locale.atof(params.get("remain_work_qty"))
-            if params.get("remain_work_qty")
-            else None
-        )
-        # The planned units for all labor resources assigned to the activity.
-        self.target_work_qty = (
-            locale.atof(params.get("target_work_qty"))
-            if params.get("target_work_qty")
-            else None
-        )
-        # Original Duration is the planned working time for the resource assignment on the activity,
-        # from the resource's planned start date to the planned finish date. The planned working time is computed
-        # using the calendar determined by the Activity Type. Resource Dependent activities use the resource's
-        # calendar; other activity types use the activity's calendar. This is the duration that Timesheets users
-        # follow and the schedule variance is measured against.
-        self.target_drtn_hr_cnt = (
-            locale.atof(params.get("target_drtn_hr_cnt").strip())
-            if params.get("target_drtn_hr_cnt")
-            else None
-        )
-        # The planned units for all nonlabor resources assigned to the activity.
-        self.target_equip_qty = (
-            locale.atof(params.get("target_equip_qty"))
-            if params.get("target_equip_qty")
-            else None
-        )
-        # The actual units for all nonlabor resources assigned to the activities under the WBS.
-        self.act_equip_qty = (
-            locale.atof(params.get("act_equip_qty"))
-            if params.get("act_equip_qty")
-            else None
-        )
-        # The remaining units for all nonlabor resources assigned to the activity. The remaining units reflects the
-        # work remaining to be done for the activity.  Before the activity is started, the remaining units are the
-        # same as the planned units. After the activity is completed, the remaining units are zero.
-        self.remain_equip_qty = (
-            locale.atof(params.get("remain_equip_qty"))
-            if params.get("remain_equip_qty")
-            else None
-        )
-        # The constraint date for the activity, if the activity has a constraint. The activity's constraint type
-        # determines whether this is a start date or finish date.  Activity constraints are used by the project
-        # scheduler.
-        self.cstr_date = (
-            datetime.strptime(params.get("cstr_date"), "%Y-%m-%d %H:%M")
-            if params.get("cstr_date")
-            else None
-        )
-        # The date on which the activity is actually started.
-        self.act_start_date = (
-            datetime.strptime(params.get("act_start_date"), "%Y-%m-%d %H:%M")
-            if params.get("act_start_date")
-            else None
-        )
-        # The date on which the activity is actually finished.
-        self.act_end_date = (
-            datetime.strptime(params.get("act_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("act_end_date")
-            else None
-        )
-        # the activity late start date
-        self.late_start_date = (
-            datetime.strptime(params.get("late_start_date"), "%Y-%m-%d %H:%M")
-            if params.get("late_start_date")
-            else None
-        )
-        # The latest possible date the activity must finish without delaying the project finish date. This date is
-        # computed by the project scheduler based on network logic, schedule
-        # constraints, and resource availability.
-        self.late_end_date = (
-            datetime.strptime(params.get("late_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("late_end_date")
-            else None
-        )
-        # The date the activity is expected to be finished according to the progress made on the activity's work
-        # products. The expected finish date is entered manually by people familiar with progress of the activity's
-        # work products.
-        self.expect_end_date = (
-            datetime.strptime(params.get("expect_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("expect_end_date")
-            else None
-        )
-        # The earliest possible date the remaining work for the activity can begin. This date is computed by the
-        # project scheduler based on network logic, schedule constraints, and resource availability.
-        self.early_start_date = (
-            datetime.strptime(params.get("early_start_date"), "%Y-%m-%d %H:%M")
-            if params.get("early_start_date")
-            else None
-        )
-        # The earliest possible date the activity can finish. This date is computed by the project scheduler based on
-        #  network logic, schedule constraints, and resource availability.
-        self.early_end_date = (
-            datetime.strptime(params.get("early_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("early_end_date")
-            else None
-        )
-        # The date the remaining work for the activity is scheduled to begin. This date is computed by the project
-        # scheduler but can be updated manually by the project manager.  Before the activity is started,
-        # the remaining start date is the same as the planned start date.  This is the start date that Timesheets
-        # users follow.
-        self.restart_date = (
-            datetime.strptime(params.get("restart_date"), "%Y-%m-%d %H:%M")
-            if params.get("restart_date")
-            else None
-        )
-        # The date the remaining work for the activity is scheduled to finish. This date is computed by the project
-        # scheduler but can be updated manually by the project manager. Before the activity is started, the remaining
-        # finish date is the same as the planned finish date.  This is the finish
-        # date that Timesheets users follow.
-        self.reend_date = (
-            datetime.strptime(params.get("reend_date"), "%Y-%m-%d %H:%M")
-            if params.get("reend_date")
-            else None
-        )
-        # The date the activity is scheduled to begin. This date is computed by the project scheduler but can be
-        # updated manually by the project manager. This date is not changed by the project scheduler after the
-        # activity has been started.
-        self.target_start_date = (
-            datetime.strptime(params.get("target_start_date"), "%Y-%m-%d %H:%M")
-            if params.get("target_start_date")
-            else None
-        )
-        # The date the activity is scheduled to finish. This date is computed by the project scheduler but can be
-        # updated manually by the project manager.  This date is not changed by the project scheduler after the
-        # activity has been started.
-        self.target_end_date = (
-            datetime.strptime(params.get("target_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("target_end_date")
-            else None
-        )
-        # Remaining late start date is calculated by the scheduler.
-        self.rem_late_start_date = (
-            datetime.strptime(params.get("rem_late_start_date"), "%Y-%m-%d %H:%M")
-            if params.get("rem_late_start_date")
-            else None
-        )
-        # Remaining late end date is calculated by the scheduler.
-        self.rem_late_end_date = (
-            datetime.strptime(params.get("rem_late_end_date"), "%Y-%m-%d %H:%M")
-            if params.get("rem_late_end_date")
-            else None
-        )
-        # The type of constraint applied to the activity start or finish date. Activity constraints are used by the
-        # project scheduler.  Start date constraints are 'Start On', 'Start On or Before', 'Start On or After' and
-        # 'Mandatory Start'.  Finish date constraints are 'Finish On', 'Finish On or Before', 'Finish On or After'
-        # and 'Mandatory Finish'.  Another type of constraint, 'As Late as Possible', schedules the activity as late
-        # as possible based on the available free int.
-        self.cstr_type = (
-            params.get("cstr_type").strip() if params.get("cstr_type") else None
-        )
-        self.priority_type = (
-            params.get("priority_type").strip() if params.get("priority_type") else None
-        )
-        # The date progress is suspended on an activity.
-        self.suspend_date = (
-            datetime.strptime(params.get("suspend_date").strip(), "%Y-%m-%d %H:%M")
-            if params.get("suspend_date")
-            else None
-        )
-        # The date progress is resumed on an activity.
-        self.resume_date = (
-            datetime.strptime(params.get("resume_date").strip(), "%Y-%m-%d %H:%M")
-            if params.get("resume_date")
-            else None
-        )
-        self.int_path = (
-            params.get("int_path").strip() if params.get("int_path") else None
-        )
-        # This field is computed by the project scheduler and identifies the order in which the activities were
-        # processed within the int path.
-        self.int_path_order = (
-            params.get("int_path_order").strip()
-            if params.get("int_path_order")
-            else None
-        )
-        self.guid = params.get("guid").strip() if params.get("guid") else None
-        self.tmpl_guid = (
-            params.get("tmpl_guid").strip() if params.get("tmpl_guid") else None
-        )
-        # The second constraint date for the activity, if the activity has a constraint.
-        self.cstr_date2 = (
-            datetime.strptime(params.get("cstr_date2"), "%Y-%m-%d %H:%M")
-            if params.get("cstr_date2")
-            else None
-        )
-        # The second type of constraint applied to the activity start or finish date.
-        self.cstr_type2 = (
-            params.get("cstr_type2").strip() if params.get("cstr_type2") else None
-        )
-        self.driving_path_flag = (
-            params.get("driving_path_flag") if params.get("driving_path_flag") else None
-        )
-        # The actual this period units for all labor resources assigned to the activity.
-        self.act_this_per_work_qty = (
-            locale.atof(params.get("act_this_per_work_qty"))
-            if params.get("act_this_per_work_qty")
-            else None
-        )
-        # The actual this period units for all nonlabor resources assigned to the activity.
-        self.act_this_per_equip_qty = (
-            locale.atof(params.get("act_this_per_equip_qty"))
-            if params.get("act_this_per_equip_qty")
-            else None
-        )
-        # The External Early Start date is the date the external relationship was scheduled to finish.  This date may
-        #  be used to calculate the start date of the current activity during scheduling.  This field is populated on
-        #  import when an external relationship is lost.
+        self._params = params
+        # Unique ID generated by the system; converted eagerly because
+        # nearly every container lookup and index keys on it.
+        self.task_id = int_or_none(params, "task_id")
+        # The data container holds the task list, so a strong back-reference
+        # would create N_tasks reference cycles that only the garbage
+        # collector could reclaim; the proxy forwards attribute access
+        # without keeping the container alive.
+        self.data = weakref.proxy(data) if data is not None else None
+        self.logic_missing = False
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when a slot has not been filled yet: convert the raw
+        # value, cache it in its slot and return it, so each field is
+        # converted at most once per task.
+        if name == "calendar":
+            # Resolved against this parse's calendar container, so a task
+            # keeps pointing at its own file's calendar even after another
+            # Reader is constructed in the same process.
+            clndr_id = self.clndr_id
+            if clndr_id is not None and self.data is not None:
+                calendar = self.data.calendars.find_by_id(clndr_id)
+            else:
+                calendar = None
+            self.calendar = calendar
+            return calendar
         try:
-            self.external_early_start_date = (
-                datetime.strptime(
-                    params.get("external_early_start_date").strip(), "%Y-%m-%d %H:%M"
-                )
-                if params.get("external_early_start_date")
-                else None
-            )
-            self.external_late_end_date = (
-                datetime.strptime(
-                    params.get("external_late_end_date"), "%Y-%m-%d %H:%M"
-                )
-                if params.get("external_late_end_date")
-                else None
-            )
-        except BaseException:
-            pass
-        self.create_date = (
-            datetime.strptime(params.get("create_date"), "%Y-%m-%d %H:%M")
-            if params.get("create_date")
-            else None
-        )
-        self.update_date = (
-            datetime.strptime(params.get("update_date"), "%Y-%m-%d %H:%M")
-            if params.get("update_date")
-            else None
-        )
-        self.create_user = (
-            params.get("create_user").strip() if params.get("create_user") else None
-        )
-        self.update_user = (
-            params.get("update_user").strip() if params.get("update_user") else None
-        )
-        self.location_id = (
-            params.get("location_id").strip() if params.get("location_id") else None
-        )
-        self.calendar = Calendar.find_by_id(self.clndr_id)
-        # self.wbs = WBS.find_by_id(int(self.wbs_id) if self.wbs_id else None)
-        # Task.obj_list.append(self)
-        self.data = data
-        self.logic_missing = False  # Initialize logic_missing attribute
+            conv, key = _FIELD_SPECS[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        value = conv(self._params, key)
+        setattr(self, name, value)
+        return value
+
+    # Generated from _FIELD_SPECS at import time; converts every remaining
+    # raw field in one pass and drops the params dict.
+    _materialize_all = _compile_materialize_all(_FIELD_SPECS)
 
     def get_tsv(self) -> list[Any]:
         """
@@ -455,117 +385,13 @@ class Task:
         List[Any]
             Task data formatted for TSV output
         """
-        return [
-            "%R",
-            self.task_id,
-            self.proj_id,
-            self.wbs_id,
-            self.clndr_id,
-            self.phys_complete_pct,
-            self.rev_fdbk_flag,
-            self.est_wt,
-            self.lock_plan_flag,
-            self.auto_compute_act_flag,
-            self.complete_pct_type,
-            self.task_type,
-            self.duration_type,
-            self.status_code,
-            self.task_code,
-            self.task_name,
-            self.rsrc_id,
-            self.total_float_hr_cnt,
-            self.free_float_hr_cnt,
-            self.remain_drtn_hr_cnt,
-            self.act_work_qty,
-            self.remain_work_qty,
-            self.target_work_qty,
-            self.target_drtn_hr_cnt,
-            self.target_equip_qty,
-            self.act_equip_qty,
-            self.remain_equip_qty,
-            self.cstr_date.strftime("%Y-%m-%d %H:%M") if self.cstr_date else None,
-            (
-                self.act_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.act_start_date
-                else None
-            ),
-            self.act_end_date.strftime("%Y-%m-%d %H:%M") if self.act_end_date else None,
-            (
-                self.late_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.late_start_date
-                else None
-            ),
-            (
-                self.late_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.late_end_date
-                else None
-            ),
-            (
-                self.expect_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.expect_end_date
-                else None
-            ),
-            (
-                self.early_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.early_start_date
-                else None
-            ),
-            (
-                self.early_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.early_end_date
-                else None
-            ),
-            self.restart_date.strftime("%Y-%m-%d %H:%M") if self.restart_date else None,
-            self.reend_date.strftime("%Y-%m-%d %H:%M") if self.reend_date else None,
-            (
-                self.target_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.target_start_date
-                else None
-            ),
-            (
-                self.target_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.target_end_date
-                else None
-            ),
-            (
-                self.rem_late_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.rem_late_start_date
-                else None
-            ),
-            (
-                self.rem_late_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.rem_late_end_date
-                else None
-            ),
-            self.cstr_type,
-            self.priority_type,
-            self.suspend_date.strftime("%Y-%m-%d %H:%M") if self.suspend_date else None,
-            self.resume_date.strftime("%Y-%m-%d %H:%M") if self.resume_date else None,
-            self.int_path,
-            self.int_path_order,
-            self.guid,
-            self.tmpl_guid,
-            self.cstr_date2.strftime("%Y-%m-%d %H:%M") if self.cstr_date2 else None,
-            self.cstr_type2,
-            self.driving_path_flag,
-            self.act_this_per_work_qty,
-            self.act_this_per_equip_qty,
-            (
-                self.external_early_start_date.strftime("%Y-%m-%d %H:%M")
-                if self.external_early_start_date
-                else None
-            ),
-            (
-                self.external_late_end_date.strftime("%Y-%m-%d %H:%M")
-                if self.external_late_end_date
-                else None
-            ),
-            self.create_date.strftime("%Y-%m-%d %H:%M") if self.create_date else None,
-            self.update_date.strftime("%Y-%m-%d %H:%M") if self.update_date else None,
-            self.create_user,
-            self.update_user,
-            self.location_id,
-        ]
+        self._materialize_all()
+        row = ["%R", *_TSV_GET(self)]
+        for i in _TSV_DT_IDX:
+            v = row[i]
+            if v is not None:
+                row[i] = fmt_dt(v)
+        return row
 
     @property
     def id(self) -> int:
@@ -589,11 +415,9 @@ class Task:
         float or None
             Total float in days (8 hours per day), or None if not available
         """
-        if self.total_int_hr_cnt:
-            tf = int(self.total_int_hr_cnt) / 8.0
-        else:
-            return None
-        return tf
+        if self.total_float_hr_cnt:
+            return self.total_float_hr_cnt / 8.0
+        return None
 
     @property
     def resources(self) -> list[Any]:
@@ -605,6 +429,11 @@ class Task:
         List[Any]
             List of TaskRsrc objects assigned to this task
         """
+        # An AttributeError escaping a property would be re-dispatched
+        # through __getattr__ and masked as "no attribute 'resources'",
+        # so the detached-task case is guarded explicitly (same below).
+        if self.data is None:
+            return []
         return self.data.taskresource.find_by_activity_id(self.task_id)
 
     @property
@@ -617,7 +446,9 @@ class Task:
         List[Any]
             List of TaskProc objects belonging to this task
         """
-        return TaskProcs.find_by_activity_id(self.task_id)
+        if self.data is None:
+            return []
+        return self.data.taskprocs.find_by_activity_id(self.task_id)
 
     @property
     def activitycodes(self) -> list[Any]:
@@ -629,6 +460,8 @@ class Task:
         List[Any]
             List of TaskActv objects assigned to this task
         """
+        if self.data is None:
+            return []
         return self.data.taskactvcodes.find_by_activity_id(self.task_id)
 
     @property
@@ -636,19 +469,29 @@ class Task:
         """
         Get the duration of the task in days.
 
+        The value is computed once and cached in its slot: the property is
+        hit for every activity by any report, and the calendar hop plus
+        divide are the same on every call. (``functools.cached_property``
+        needs a ``__dict__``, which slots deliberately removed.)
+
         Returns
         -------
         float
             Duration in days (calculated from hours based on calendar working hours)
         """
-        dur = None
+        try:
+            return self._duration
+        except AttributeError:
+            pass
         if self.target_drtn_hr_cnt:
-            if self.calendar.day_hr_cnt:
-                dur = self.target_drtn_hr_cnt / self.calendar.day_hr_cnt
+            calendar = self.calendar
+            if calendar is not None and calendar.day_hr_cnt:
+                dur = self.target_drtn_hr_cnt / calendar.day_hr_cnt
             else:
                 dur = self.target_drtn_hr_cnt / 8.0
         else:
             dur = 0.0
+        self._duration = dur
         return dur
 
     @property
@@ -688,14 +531,19 @@ class Task:
 
         Returns the actual end date if the task has finished, otherwise the target end date.
 
+        The choice is resolved once and cached: CPM-style loops read the
+        effective end date of every task on every pass.
+
         Returns
         -------
         datetime or None
             The effective end date of the task
         """
-        if self.act_end_date:
-            return self.act_end_date
-        return self.target_end_date
+        try:
+            return self._end_date
+        except AttributeError:
+            self._end_date = self.act_end_date or self.target_end_date
+            return self._end_date
 
     @property
     def successors(self) -> list[Any]:
@@ -707,7 +555,13 @@ class Task:
         List[Any]
             List of tasks that are successors to this task
         """
-        return self.data.predecessors.get_successors(self.task_id)
+        try:
+            return self._succ
+        except AttributeError:
+            if self.data is None:
+                return []
+            self._succ = self.data.predecessors.get_successors(self.task_id)
+            return self._succ
 
     @property
     def predecessors(self) -> list[Any]:
@@ -719,13 +573,21 @@ class Task:
         List[Any]
             List of tasks that are predecessors to this task
         """
-        return self.data.predecessors.get_predecessors(self.task_id)
-
-    @classmethod
-    def find_by_wbs_id(cls, wbs_id: int) -> list["Task"]:
+        try:
+            return self._pred
+        except AttributeError:
+            if self.data is None:
+                return []
+            self._pred = self.data.predecessors.get_predecessors(self.task_id)
+            return self._pred
+
+    def find_by_wbs_id(self, wbs_id: int) -> list["Task"]:
         """
         Find all tasks belonging to a WBS element.
 
+        Tasks are owned by the Reader's container, not by a class-level
+        registry, so the lookup goes through ``data.tasks``.
+
         Parameters
         ----------
         wbs_id : int
@@ -736,7 +598,7 @@ class Task:
         List[Task]
             List of tasks belonging to the specified WBS element
         """
-        return [v for v in cls.obj_list if v.wbs_id == wbs_id]
+        return self.data.tasks.activities_by_wbs_id(wbs_id)
 
     def __repr__(self) -> str:
         """
@@ -1,34 +1,38 @@
-from typing import ClassVar
+from xer_parser.model.classes._parsers import int_or_none, intern_or_none
 
 
 class TaskActv:
-    obj_list: ClassVar[list] = []
+    __slots__ = (
+        "_tsv",
+        "actv_code_id",
+        "actv_code_type_id",
+        "data",
+        "proj_id",
+        "task_id",
+    )
 
     def __init__(self, params, data):
-        self.task_id = (
-            int(params.get("task_id").strip()) if params.get("task_id") else None
-        )
-        self.actv_code_type_id = params.get("actv_code_type_id").strip()
-        self.actv_code_id = (
-            int(params.get("actv_code_id").strip())
-            if params.get("actv_code_id")
-            else None
-        )
-        self.proj_id = (
-            int(params.get("proj_id").strip()) if params.get("proj_id") else None
-        )
+        self.task_id = int_or_none(params, "task_id")
+        # A project defines a handful of code types but assigns them to
+        # thousands of activities; interning shares one string per type.
+        self.actv_code_type_id = intern_or_none(params, "actv_code_type_id")
+        self.actv_code_id = int_or_none(params, "actv_code_id")
+        self.proj_id = int_or_none(params, "proj_id")
         self.data = data
-        TaskActv.obj_list.append(self)
-
-    def get_tsv(self):
-        tsv = [
+        # The record is four immutable fields, so its TSV row is fixed at
+        # construction; exporting then hands out the same tuple instead of
+        # rebuilding a list per assignment. Callers that want to edit a row
+        # must copy it with list().
+        self._tsv = (
             "%R",
             self.task_id,
             self.actv_code_type_id,
             self.actv_code_id,
             self.proj_id,
-        ]
-        return tsv
+        )
+
+    def get_tsv(self):
+        return self._tsv
 
     def get_id(self):
         return self.task_id
@@ -2,6 +2,8 @@
 
 import locale
 
+from xer_parser.model.classes._parsers import intern_or_none
+
 
 class TaskRsrc:
     def __init__(self, params, data=None):
@@ -138,9 +140,7 @@ class TaskRsrc:
             else None
         )
         self.guid = params.get("guid").strip() if params.get("guid") else None
-        self.rate_type = (
-            params.get("rate_type").strip() if params.get("rate_type") else None
-        )
+        self.rate_type = intern_or_none(params, "rate_type")
         self.act_this_per_cost = (
             params.get("act_this_per_cost").strip()
             if params.get("act_this_per_cost")
@@ -152,9 +152,7 @@ class TaskRsrc:
             else None
         )
         self.curv_id = params.get("curv_id").strip() if params.get("curv_id") else None
-        self.rsrc_type = (
-            params.get("rsrc_type").strip() if params.get("rsrc_type") else None
-        )
+        self.rsrc_type = intern_or_none(params, "rsrc_type")
         self.cost_per_qty_source_type = (
             params.get("cost_per_qty_source_type").strip()
             if params.get("cost_per_qty_source_type")
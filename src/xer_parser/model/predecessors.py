@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Any
 
 from xer_parser.model.classes.taskpred import TaskPred
@@ -37,6 +38,11 @@ class Predecessors:
         """
         self.index = 0
         self.task_pred = []
+        # Adjacency indexes of the relationship graph, filled in add():
+        # _by_pred groups relations by predecessor activity (successor
+        # lookups), _by_task by successor activity (predecessor lookups).
+        self._by_pred = defaultdict(list)
+        self._by_task = defaultdict(list)
 
     def find_by_id(self, code_id: int) -> TaskPred | None:
         """
@@ -52,10 +58,7 @@ class Predecessors:
         TaskPred or None
             The relationship with the specified ID, or None if not found
         """
-        obj = list(filter(lambda x: x.task_pred_id == code_id, self.task_pred))
-        if len(obj) > 0:
-            return obj[0]
-        return None
+        return next((x for x in self.task_pred if x.task_pred_id == code_id), None)
 
     def get_tsv(self) -> list[list[Any]]:
         """
@@ -100,6 +103,8 @@ class Predecessors:
         """
         pred = TaskPred(params)
         self.task_pred.append(pred)
+        self._by_pred[pred.pred_task_id].append(pred)
+        self._by_task[pred.task_id].append(pred)
 
     @property
     def relations(self) -> list[TaskPred]:
@@ -153,8 +158,7 @@ class Predecessors:
         list[TaskPred]
             List of relationships where the specified activity is a predecessor
         """
-        succ = list(filter(lambda x: x.pred_task_id == act_id, self.task_pred))
-        return succ
+        return self._by_pred.get(act_id, [])
 
     def get_predecessors(self, act_id: int) -> list[TaskPred]:
         """
@@ -170,8 +174,7 @@ class Predecessors:
         list[TaskPred]
             List of relationships where the specified activity is a successor
         """
-        succ = list(filter(lambda x: x.task_id == act_id, self.task_pred))
-        return succ
+        return self._by_task.get(act_id, [])
 
     def count(self) -> int:
         """
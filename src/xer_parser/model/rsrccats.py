@@ -7,6 +7,7 @@ class ResourceCategories:
     def __init__(self) -> None:
         self.index = 0
         self._rsrccat = []
+        self._by_rsrc_id = {}
 
     def get_tsv(self):
         tsv = []
@@ -18,13 +19,12 @@ class ResourceCategories:
         return tsv
 
     def add(self, params):
-        self._rsrccat.append(ResourceCat(params))
+        rc = ResourceCat(params)
+        self._rsrccat.append(rc)
+        self._by_rsrc_id[rc.rsrc_id] = rc
 
-    def find_by_id(self, id) -> ResourceCat:
-        obj = list(filter(lambda x: x.actv_code_type_id == id, self._rsrccat))
-        if len(obj) > 0:
-            return obj[0]
-        return obj
+    def find_by_id(self, id) -> ResourceCat | None:
+        return self._by_rsrc_id.get(id)
 
     @property
     def count(self):
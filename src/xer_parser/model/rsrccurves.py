@@ -7,15 +7,24 @@ class ResourceCurves:
     def __init__(self) -> None:
         self.index = 0
         self._resourcecurves = []
+        self._by_id = {}
 
     def add(self, params):
-        self._resourcecurves.append(ResourceCurve(params))
+        curve = ResourceCurve(params)
+        self._resourcecurves.append(curve)
+        self._by_id[curve.curv_id] = curve
 
-    def find_by_id(self, id) -> ResourceCurve:
-        obj = list(filter(lambda x: x.actv_code_type_id == id, self._resourcecurves))
-        if len(obj) > 0:
-            return obj[0]
-        return obj
+    def find_by_id(self, id) -> ResourceCurve | None:
+        return self._by_id.get(id)
+
+    def curve_matrix(self):
+        """Return the curves of this parse as packed 21-column rows.
+
+        Each row is the curve's ``array('d')`` percentage buffer (missing
+        values as NaN), so bulk curve math can run over contiguous numeric
+        data instead of per-attribute lookups.
+        """
+        return [c.pct_usage for c in self._resourcecurves]
 
     def get_tsv(self):
         tsv = []
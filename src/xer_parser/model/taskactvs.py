@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from xer_parser.model.classes.taskactv import TaskActv
 
 __all__ = ["TaskActvs"]
@@ -7,9 +9,14 @@ class TaskActvs:
     def __init__(self) -> None:
         self.index = 0
         self._taskactvs = []
+        self._by_task = defaultdict(list)
+        self._by_code = defaultdict(list)
 
     def add(self, params, data):
-        self._taskactvs.append(TaskActv(params, data))
+        taskactv = TaskActv(params, data)
+        self._taskactvs.append(taskactv)
+        self._by_task[taskactv.task_id].append(taskactv)
+        self._by_code[taskactv.actv_code_id].append(taskactv)
 
     def get_tsv(self):
         tsv = []
@@ -23,16 +30,10 @@ class TaskActvs:
         return tsv
 
     def find_by_code_id(self, id) -> TaskActv:
-        obj = list(filter(lambda x: x.actv_code_id == id, self._taskactvs))
-        if len(obj) > 0:
-            return obj
-        return obj
+        return self._by_code.get(id, [])
 
     def find_by_activity_id(self, id) -> TaskActv:
-        obj = list(filter(lambda x: x.task_id == id, self._taskactvs))
-        if len(obj) > 0:
-            return obj
-        return obj
+        return self._by_task.get(id, [])
 
     def count(self):
         return len(self._taskactvs)
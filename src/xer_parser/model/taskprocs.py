@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from xer_parser.model.classes.taskproc import TaskProc
 
 __all__ = ["TaskProcs"]
@@ -7,9 +9,12 @@ class TaskProcs:
     def __init__(self) -> None:
         self.index = 0
         self._TaskProcs = []
+        self._by_task = defaultdict(list)
 
     def add(self, params):
-        self._TaskProcs.append(TaskProc(params))
+        proc = TaskProc(params)
+        self._TaskProcs.append(proc)
+        self._by_task[proc.task_id].append(proc)
 
     def get_tsv(self):
         if len(self._TaskProcs) > 0:
@@ -41,8 +46,7 @@ class TaskProcs:
         return obj
 
     def find_by_activity_id(self, id):
-        objs = list(filter(lambda x: x.task_id == id, self._TaskProcs))
-        return objs
+        return self._by_task.get(id, [])
 
     @property
     def count(self):
@@ -1,5 +1,8 @@
+import weakref
+from collections import defaultdict
+from operator import attrgetter
+
 from xer_parser.model.classes.task import Task
-from xer_parser.model.classes.taskactv import TaskActv
 from xer_parser.model.classes.taskpred import TaskPred
 
 __all__ = ["Tasks"]
@@ -13,10 +16,23 @@ class Tasks:
     def __init__(self) -> None:
         self.index = 0
         self._tasks = []
+        self._by_wbs = defaultdict(list)
+        self._by_status = None
+        self._data = None
 
     def add(self, params, data) -> None:
+        # Construction is cheap by design: field conversion is deferred, so
+        # each Task costs one slotted allocation and four attribute stores
+        # here. Batch-allocating bare instances via Task.__new__ would save
+        # only the constructor frame while the reader streams rows one at a
+        # time anyway.
+        if self._data is None and data is not None:
+            # Same container for every row of a parse; kept as a proxy so
+            # the Tasks <-> Data pair does not form a reference cycle.
+            self._data = weakref.proxy(data)
         task = Task(params, data)
         self._tasks.append(task)
+        self._by_wbs[task.wbs_id].append(task)
 
     @property
     def activities(self) -> list[Task]:
@@ -26,6 +42,27 @@ class Tasks:
     def count(self) -> int:
         return len(self._tasks)
 
+    def columns(self, *fields: str) -> dict[str, list]:
+        """Extract task fields as parallel per-field lists.
+
+        Bulk analytics (filtering, summing durations, date arithmetic) touch
+        a few fields across every task; pulling them into columns up front
+        avoids walking each full Task object per pass. Rows keep their
+        parse order, so index i in every list belongs to the same task.
+
+        >>> cols = xer.activities.columns("task_id", "wbs_id")  # doctest: +SKIP
+        """
+        if not fields:
+            raise ValueError("at least one field name is required")
+        if not self._tasks:
+            return {f: [] for f in fields}
+        get = attrgetter(*fields)
+        if len(fields) == 1:
+            return {fields[0]: [get(t) for t in self._tasks]}
+        return dict(
+            zip(fields, (list(col) for col in zip(*map(get, self._tasks))))
+        )
+
     @property
     def has_no_successor(self) -> list:
         return list(
@@ -62,16 +99,11 @@ class Tasks:
         return list(filter(lambda x: x is not None, lst))
 
     def find_by_id(self, id):  # TODO: Add correct return type annotation
-        obj = list(filter(lambda x: x.task_id == id, self._tasks))
-        if len(obj) > 0:
-            return obj[0]
-        return obj
+        # Early-exit scan; returns [] on a miss for backward compatibility.
+        return next((x for x in self._tasks if x.task_id == id), [])
 
     def find_by_code(self, code):  # TODO: Add correct return type annotation
-        obj = list(filter(lambda x: x.task_code == code, self._tasks))
-        if len(obj) > 0:
-            return obj[0]
-        return obj
+        return next((x for x in self._tasks if x.task_code == code), [])
 
     def duration_greater_than(
         self, duration
@@ -144,13 +176,33 @@ class Tasks:
         return obj
 
     def activities_by_status(self, status):
-        return list(filter(lambda x: x.status_code == status, self._tasks))
+        # Grouped once on first use rather than filtering the whole task
+        # list per query; status_code is lazy on Task, so building the
+        # index also materializes that one column across the project.
+        if self._by_status is None:
+            by_status = defaultdict(list)
+            for task in self._tasks:
+                by_status[task.status_code].append(task)
+            self._by_status = by_status
+        return self._by_status.get(status, [])
 
     def activities_by_wbs_id(self, id):
-        return list(filter(lambda x: x.wbs_id == id, self._tasks))
+        return self.find_by_wbs_id(id)
+
+    def find_by_wbs_id(self, wbs_id):
+        """Return the tasks under the given wbs_id, or [] when none match.
+
+        Every query hits the group-by index filled during add, so repeat
+        lookups are O(1) without a memoization layer; the index lives on
+        the container and is dropped with the parse, unlike a cache keyed
+        on wbs_id alone, which could leak results across Reader instances.
+        """
+        return self._by_wbs.get(wbs_id, [])
 
     def activities_by_activity_code_id(self, id):
-        objs = list(filter(lambda x: x.actv_code_id == id, TaskActv.obj_list))
+        if self._data is None:
+            return []
+        objs = self._data.taskactvcodes.find_by_code_id(id)
         activities = []
         for obj in objs:
             activities.append(self.find_by_id(obj.task_id))
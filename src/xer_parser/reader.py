@@ -139,64 +139,9 @@ class Reader:
 
         None
         """
-        if object_type.strip() == "CURRTYPE":
-            self._currencies.add(params)
-        elif object_type.strip() == "ROLES":
-            self._roles.add(params)
-        elif object_type.strip() == "ACCOUNT":
-            self._accounts.add(params)
-        elif object_type.strip() == "ROLERATE":
-            self._rolerates.add(params)
-        elif object_type.strip() == "OBS":
-            self._obss.add(params)
-        elif object_type.strip() == "RCATTYPE":
-            self._rcattypes.add(params)
-        elif object_type.strip() == "UDFTYPE":
-            self._udftypes.add(params)
-        elif object_type.strip() == "RCATVAL":
-            self._rcatvals.add(params)
-        elif object_type.strip() == "PROJECT":
-            self._projects.add(params, self._data)
-        elif object_type.strip() == "CALENDAR":
-            self._calendars.add(params)
-        elif object_type.strip() == "SCHEDOPTIONS":
-            self._schedoptions.add(params)
-        elif object_type.strip() == "PROJWBS":
-            self._wbss.add(params, self._data)
-        elif object_type.strip() == "RSRC":
-            self._resources.add(params)
-        elif object_type.strip() == "RSRCCURVDATA":
-            self._rsrcurves.add(params)
-        elif object_type.strip() == "ACTVTYPE":
-            self._acttypes.add(params)
-        elif object_type.strip() == "PCATTYPE":
-            self._pcattypes.add(params)
-        elif object_type.strip() == "PROJPCAT":
-            self._projpcats.add(params)
-        elif object_type.strip() == "PCATVAL":
-            self._pcatvals.add(params)
-        elif object_type.strip() == "RSRCRATE":
-            self._rsrcrates.add(params)
-        elif object_type.strip() == "RSRCRCAT":
-            self._rsrccats.add(params)
-        elif object_type.strip() == "TASK":
-            self._tasks.add(params, self._data)
-        elif object_type.strip() == "ACTVCODE":
-            self._actvcodes.add(params)
-        elif object_type.strip() == "TASKPRED":
-            self._predecessors.add(params)
-        elif object_type.strip() == "TASKRSRC":
-            self._activityresources.add(params, self._data)
-        elif object_type.strip() == "TASKPROC":
-            self._taskprocs.add(params)
-        elif object_type.strip() == "TASKACTV":
-            self._activitycodes.add(params, self._data)
-        elif object_type.strip() == "UDFVALUE":
-            self._udfvalues.add(params)
-        elif object_type.strip() == "FINTMPL":
-            self._fintmpls.add(params)
-        elif object_type.strip() == "NONWORK":
-            self._nonworks.add(params)
+        handler = self._handlers.get(object_type.strip())
+        if handler is not None:
+            handler(params)
 
     def summary(self) -> None:
         """
@@ -624,20 +569,72 @@ class Reader:
         self._data.projects = self._projects
         self._data.wbss = self._wbss
         self._data.tasks = self._tasks
+        self._data.calendars = self._calendars
         self._data.resources = self._resources
         self._data.taskresource = self._activityresources
         self._data.taskactvcodes = self._activitycodes
+        self._data.taskprocs = self._taskprocs
         self._data.predecessors = self._predecessors
+        # Table-name -> add-method dispatch for the record loop. Built once
+        # per Reader so each %R row costs a single dict lookup instead of a
+        # walk down an if/elif chain of string compares.
+        add_with_data = {
+            "PROJECT": self._projects,
+            "PROJWBS": self._wbss,
+            "TASK": self._tasks,
+            "TASKRSRC": self._activityresources,
+            "TASKACTV": self._activitycodes,
+        }
+        add_plain = {
+            "CURRTYPE": self._currencies,
+            "ROLES": self._roles,
+            "ACCOUNT": self._accounts,
+            "ROLERATE": self._rolerates,
+            "OBS": self._obss,
+            "RCATTYPE": self._rcattypes,
+            "UDFTYPE": self._udftypes,
+            "RCATVAL": self._rcatvals,
+            "CALENDAR": self._calendars,
+            "SCHEDOPTIONS": self._schedoptions,
+            "RSRC": self._resources,
+            "RSRCCURVDATA": self._rsrcurves,
+            "ACTVTYPE": self._acttypes,
+            "PCATTYPE": self._pcattypes,
+            "PROJPCAT": self._projpcats,
+            "PCATVAL": self._pcatvals,
+            "RSRCRATE": self._rsrcrates,
+            "RSRCRCAT": self._rsrccats,
+            "ACTVCODE": self._actvcodes,
+            "TASKPRED": self._predecessors,
+            "TASKPROC": self._taskprocs,
+            "UDFVALUE": self._udfvalues,
+            "FINTMPL": self._fintmpls,
+            "NONWORK": self._nonworks,
+        }
+        self._handlers = {name: c.add for name, c in add_plain.items()}
+        self._handlers.update(
+            (name, (lambda params, c=c: c.add(params, self._data)))
+            for name, c in add_with_data.items()
+        )
         with codecs.open(filename, encoding="utf-8", errors="ignore") as tsvfile:
             stream = csv.reader(tsvfile, delimiter="\t")
+            # The handler only changes on a %T row, so it is resolved there
+            # once per table instead of once per record; %R rows (the vast
+            # majority of the file) then call the bound add method directly.
+            current_handler = None
+            current_headers: list[str] = []
+            _dict, _zip = dict, zip
             for row in stream:
-                if row[0] == "%T":
-                    current_table = row[1]
-                elif row[0] == "%F":
+                tag = row[0]
+                if tag == "%R":
+                    if current_handler is not None:
+                        current_handler(
+                            _dict(_zip(current_headers, row[1:], strict=False))
+                        )
+                elif tag == "%T":
+                    current_handler = self._handlers.get(row[1].strip())
+                elif tag == "%F":
                     current_headers = [r.strip() for r in row[1:]]
-                elif row[0] == "%R":
-                    zipped_record = dict(zip(current_headers, row[1:], strict=False))
-                    self.create_object(current_table, zipped_record)
 
         # for line in content:
         #     line_lst = line.split('\t')
@@ -1,3 +1,9 @@
+from datetime import datetime
+
+import pytest
+
+from xer_parser.model.classes.rsrcrcat import ResourceCat
+from xer_parser.model.classes.task import Task
 from xer_parser.reader import Reader
 
 
@@ -34,3 +40,69 @@ def test_relations_property(sample_xer):
     relations = sample_xer.relations
     assert relations is not None
     # Add more specific assertions based on your sample.xer content
+
+
+def test_totalint_returns_float_in_days():
+    """Test that totalint converts total float from hours to days"""
+    task = Task({"task_id": "1", "total_float_hr_cnt": "16"}, None)
+    assert task.totalint == 2.0
+    assert Task({"task_id": "2"}, None).totalint is None
+
+
+def test_container_len_matches_contents(sample_xer):
+    """Test that len() works on the record containers"""
+    assert len(sample_xer.projects) == sum(1 for _ in sample_xer.projects)
+    assert len(sample_xer.activityresources) == sample_xer.activityresources.count
+    assert len(sample_xer.projects) > 0
+
+
+def test_resourcecat_reads_its_own_columns():
+    """Test that each RSRCRCAT column lands on the matching attribute"""
+    rc = ResourceCat({"rsrc_id": "1", "rsrc_catg_type_id": "2", "rsrc_catg_id": "3"})
+    assert rc.rsrc_id == 1
+    assert rc.rsrc_catg_type_id == 2
+    assert rc.rsrc_catg_id == 3
+
+
+def test_second_reader_keeps_first_readers_calendars(sample_xer_path):
+    """Test that constructing a new Reader does not rebind earlier tasks' calendars"""
+    first = Reader(sample_xer_path)
+    task = next(t for t in first.activities.activities if t.clndr_id is not None)
+    second = Reader(sample_xer_path)
+    assert task.calendar is first.calendars.find_by_id(task.clndr_id)
+    assert task.calendar is not second.calendars.find_by_id(task.clndr_id)
+
+
+def test_detached_task_properties_do_not_mask_errors():
+    """Test that tasks without a calendar or data container stay usable"""
+    task = Task({"task_id": "1", "target_drtn_hr_cnt": "80"}, None)
+    assert task.calendar is None
+    assert task.duration == 10.0  # falls back to 8-hour days
+    assert task.resources == []
+    assert task.successors == []
+
+
+def test_external_dates_parse_and_fail_loudly():
+    """Test that external date fields parse normally and bad values raise"""
+    task = Task(
+        {"task_id": "1", "external_early_start_date": "2024-01-02 03:04"}, None
+    )
+    assert task.external_early_start_date == datetime(2024, 1, 2, 3, 4)
+
+    bad = Task({"task_id": "2", "external_late_end_date": "not a date"}, None)
+    with pytest.raises(ValueError):
+        bad.external_late_end_date  # noqa: B018
+
+    # Trailing garbage after a valid prefix must not be silently dropped
+    trailing = Task(
+        {"task_id": "3", "external_late_end_date": "2024-01-02 03:04:59"}, None
+    )
+    with pytest.raises(ValueError):
+        trailing.external_late_end_date  # noqa: B018
+
+    # Wrong separators must not slip past the fixed-width fast path
+    separators = Task(
+        {"task_id": "4", "external_late_end_date": "2024-01-02T03:04"}, None
+    )
+    with pytest.raises(ValueError):
+        separators.external_late_end_date  # noqa: B018